@@ -0,0 +1,196 @@
+"""Startprofil des Dashboards messen.
+
+Aufruf:  python startup_benchmark.py [--runs 5] [--script PFAD] > bench_output.txt
+
+Jeder Lauf startet einen frischen Interpreter und führt das echte Dashboard-Skript
+einmal über streamlit.testing.v1.AppTest aus (leerer Cache = Kaltstart). Nur die
+Google-Sheets-Zugriffe werden durch Testdaten ersetzt, alle Imports bleiben echt.
+Gemessen wird ab Prozessstart:
+
+- "bis Banner":        bis der erste st.image/st.title-Aufruf fertig ist (erstes Element)
+- "erster Lauf":       bis das Skript einmal komplett durchgelaufen ist
+- "Rerun (warm)":      Dauer eines zweiten Laufs im selben Prozess (Daten gecacht)
+
+Der Streamlit-Server selbst (Tornado, Websocket) wird nicht gestartet; die Zahlen
+sind also die Skriptzeit eines Kaltstarts, nicht die Container-Bootzeit.
+Zum Vergleich mit einer älteren Version:
+    git show <rev>:streamlit_insta_dashboard.py > alt.py
+    python startup_benchmark.py --script alt.py
+"""
+import argparse
+import importlib.abc
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ["streamlit", "pandas", "gspread", "oauth2client.service_account", "plotly.express"]
+DEFAULT_SCRIPT = "streamlit_insta_dashboard.py"
+BANNER_PNG = "banner_statistik_dashboard.png"
+BANNER_JPG = "banner_statistik_dashboard.jpg"
+
+INSTA_SHEET_ID = "1_Ni1ALTrq3qkgXxgBaG2TNjRBodCEaYewhhTPq0aWfU"
+FAKE_SHEETS = {
+    INSTA_SHEET_ID: [
+        {"DATE": d, "CLUB_NAME": club, "URL": f"https://www.instagram.com/{club}/", "FOLLOWER": f}
+        for d, scale in (("2026-01-15", 1.0), ("2026-02-20", 1.1))
+        for club, f in (("club_a", int(1200 * scale)), ("club_b", int(800 * scale)), ("club_c", int(450 * scale)))
+    ],
+    # Alle anderen IDs: Zuschauer-Sheet
+    None: [
+        {"DATUM": datum, "HEIM": heim, "ZUSCHAUER": z, "SPIELTAG": st, "AVERAGE_SPIELTAG": z}
+        for datum, heim, z, st in (
+            ("14.09.2024", "club_a", 210, 1), ("21.09.2024", "club_b", 180, 2),
+            ("13.09.2025", "club_a", 250, 1), ("20.09.2025", "club_c", 140, 2),
+        )
+    ],
+}
+
+
+# --- Stubs für die Sheets (werden erst beim echten Import von gspread/oauth2client eingehängt) ---
+class _FakeSheet:
+    def __init__(self, sheet_id):
+        self.sheet1 = self
+        self._records = FAKE_SHEETS.get(sheet_id, FAKE_SHEETS[None])
+
+    def get_all_records(self):
+        return self._records
+
+
+class _FakeClient:
+    def open_by_key(self, sheet_id):
+        return _FakeSheet(sheet_id)
+
+
+def _patch_gspread(module):
+    module.authorize = lambda creds: _FakeClient()
+
+
+def _patch_service_account(module):
+    module.ServiceAccountCredentials.from_json_keyfile_dict = staticmethod(lambda d, scope: None)
+
+
+class _PostImportPatcher(importlib.abc.MetaPathFinder):
+    """Patcht Module direkt nach ihrem Import, ohne den Import selbst vorzuziehen."""
+
+    patches = {"gspread": _patch_gspread, "oauth2client.service_account": _patch_service_account}
+
+    def find_spec(self, name, path, target=None):
+        patch = self.patches.get(name)
+        if patch is None:
+            return None
+        sys.meta_path.remove(self)
+        try:
+            spec = importlib.util.find_spec(name)
+        finally:
+            sys.meta_path.insert(0, self)
+        exec_module = spec.loader.exec_module
+
+        def exec_and_patch(module):
+            exec_module(module)
+            patch(module)
+
+        spec.loader.exec_module = exec_and_patch
+        return spec
+
+
+def run_child(script, t0):
+    """Ein Kaltstart-Lauf; gibt die Messwerte als JSON auf stdout aus."""
+    sys.meta_path.insert(0, _PostImportPatcher())
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    result = {}
+
+    def mark_banner(original):
+        def wrapper(*args, **kwargs):
+            element = original(*args, **kwargs)
+            if "banner_s" not in result:
+                result["banner_s"] = time.time() - t0
+                result["banner_imports"] = [m for m in HEAVY_MODULES if m in sys.modules]
+            return element
+        return wrapper
+
+    st.image = mark_banner(st.image)
+    st.title = mark_banner(st.title)
+
+    at = AppTest.from_file(script, default_timeout=120)
+    at.secrets["gcp_service_account"] = {"type": "service_account"}
+    at.run()
+    result["full_s"] = time.time() - t0
+    start = time.time()
+    at.run()
+    result["rerun_s"] = time.time() - start
+    result["exception"] = [e.message for e in at.exception]
+    result["errors"] = [e.value for e in at.error]
+    print(json.dumps(result))
+
+
+def measure(script, runs):
+    """Median aus `runs` frischen Prozessen, plus -X importtime des letzten Laufs."""
+    samples = []
+    for i in range(runs):
+        t0 = time.time()
+        cmd = [sys.executable]
+        if i == runs - 1:
+            cmd += ["-X", "importtime"]
+        cmd += [os.path.abspath(__file__), "--child", script, "--t0", repr(t0)]
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise SystemExit(proc.stderr[-2000:])
+        samples.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return samples, parse_importtime(proc.stderr)
+
+
+def parse_importtime(stderr):
+    """Kumulierte Importzeit (µs) je Modul aus der -X importtime-Ausgabe."""
+    times = {}
+    for line in stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] in HEAVY_MODULES and parts[2] not in times:
+            times[parts[2]] = int(parts[1])
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--script", default=DEFAULT_SCRIPT)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--t0", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    if args.child:
+        run_child(args.child, args.t0)
+        return
+
+    samples, import_times = measure(os.path.abspath(args.script), args.runs)
+    last = samples[-1]
+    if last["exception"] or last["errors"]:
+        print(f"WARNUNG: Skript lief nicht fehlerfrei: {last['exception'] + last['errors']}")
+
+    print(f"== Importzeiten im Skriptlauf (-X importtime, kumuliert) - {args.script} ==")
+    for module in HEAVY_MODULES:
+        us = import_times.get(module)
+        print(f"{module:30s} {'-' if us is None else f'{us / 1000:8.1f} ms'}")
+
+    print(f"\n== Kaltstart ab Prozessstart (Median aus {args.runs} Läufen) ==")
+    print(f"{'bis Banner':30s} {statistics.median(s['banner_s'] for s in samples) * 1000:8.1f} ms")
+    print(f"{'erster Lauf':30s} {statistics.median(s['full_s'] for s in samples) * 1000:8.1f} ms")
+    print(f"{'Rerun (warm)':30s} {statistics.median(s['rerun_s'] for s in samples) * 1000:8.1f} ms")
+    print(f"vor dem Banner importiert: {', '.join(last['banner_imports'])}")
+
+    print("\n== Banner ==")
+    for path in (BANNER_PNG, BANNER_JPG):
+        if os.path.exists(path):
+            print(f"{path:32s} {os.path.getsize(path) / 1024:8.1f} KB")
+        else:
+            print(f"{path:32s} fehlt")
+
+
+if __name__ == "__main__":
+    main()
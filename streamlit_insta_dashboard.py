@@ -1,14 +1,13 @@
 import streamlit as st
 import pandas as pd
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
-import plotly.express as px
 from datetime import datetime, timedelta
 import streamlit.components.v1 as components
 
 # --- Konfiguration ---
 INSTA_SHEET_ID = "1_Ni1ALTrq3qkgXxgBaG2TNjRBodCEaYewhhTPq0aWfU"
 ZUSCHAUER_SHEET_ID = "14puepYtteWGPD1Qv89gCpZijPm5Yrgr8glQnGBh3PXM"
+# Banner vorab auf Anzeigebreite (450px) als JPEG - st.image liefert es unverändert aus
+BANNER_PFAD = "banner_statistik_dashboard.jpg"
 
 st.set_page_config(page_title="Futsal Statistik Dashboard", layout="wide")
 
@@ -45,6 +44,9 @@ def scroll_to_anchor():
 # --- DATEN LADEN FUNKTION ---
 @st.cache_data(ttl=3600)
 def load_data(sheet_id, secret_key):
+    # Google-Bibliotheken erst hier importieren, damit das Banner vorher erscheint
+    import gspread
+    from oauth2client.service_account import ServiceAccountCredentials
     try:
         scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
         creds_dict = st.secrets[secret_key]
@@ -59,6 +61,17 @@ def load_data(sheet_id, secret_key):
         st.error(f"Fehler beim Laden der Daten: {e}")
         return pd.DataFrame()
 
+# --- PLOTLY ERST BEIM ERSTEN DIAGRAMM LADEN ---
+def load_plotly_express():
+    import plotly.express as px
+    return px
+
+# Header-Bereich (vor dem Laden der Daten, damit die Seite sofort etwas zeigt)
+try:
+    st.image(BANNER_PFAD, width=450)
+except Exception:
+    st.title("⚽ Futsal Dashboard")
+
 # ==========================================
 # 1. DATEN-VORBEREITUNG (INSTAGRAM)
 # ==========================================
@@ -76,12 +89,6 @@ if not df_insta.empty:
 else:
     summe_follower, akt_datum = "0", "-"
 
-# Header-Bereich
-try: 
-    st.image("banner_statistik_dashboard.png", width=450)
-except: 
-    st.title("⚽ Futsal Dashboard") 
-
 st.markdown(f"[www.misterfutsal.de](https://www.misterfutsal.de) | :grey[Stand {akt_datum}]")
 st.divider()
 
@@ -93,6 +100,7 @@ tab_insta, tab_zuschauer = st.tabs(["📸 Instagram Follower", "🏟️ Bundesli
 # --- TAB 1: INSTAGRAM ---
 with tab_insta:
     if not df_insta.empty:
+        px = load_plotly_express()
         df_latest.insert(0, 'RANG', range(1, len(df_latest) + 1))
         df_latest_display = df_latest.copy()
         df_latest_display['RANG'] = df_latest_display['RANG'].astype(str)
@@ -369,6 +377,7 @@ with tab_zuschauer:
     df_z = df_z[df_z['ZUSCHAUER'] > 0]
 
     if not df_z.empty:
+        px = load_plotly_express()
         if 'DATUM' in df_z.columns: 
             df_z['DATUM'] = pd.to_datetime(df_z['DATUM'], dayfirst=True, errors='coerce')
         if 'ZUSCHAUER' in df_z.columns: 